@@ -12,9 +12,7 @@ CATEGORY_MAP = {
 }
 
 TAG_RULES = [
-    (r'C\+\+17', 'C++17'),
-    (r'C\+\+14', 'C++14'),
-    (r'C\+\+11', 'C++11'),
+    (r'C\+\+(?:11|14|17)', 'C++'),  # standard versions are aliases, see taxonomy.py
     (r'lock.?free|无锁|MPSC|SPSC|CAS', 'lock-free'),
     (r'ARM|Cortex|NEON|aarch64|Zynq', 'ARM'),
     (r'RTOS|RT-Thread|FreeRTOS', 'RTOS'),
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Incremental site build: run preprocessing stages, then Hugo.
+
+Each stage declares its inputs (glob patterns), outputs and dependencies,
+forming a DAG. Inputs are fingerprinted by content, together with the
+fingerprints of the stage's dependencies; a stage is skipped when its
+fingerprint matches the last successful run and its outputs exist.
+Stages whose dependencies are done run in parallel.
+
+Usage (from repo root):
+    python3 scripts/build.py              # incremental build
+    python3 scripts/build.py --force      # ignore cached fingerprints
+    python3 scripts/build.py --dry-run    # show which stages would run
+    python3 scripts/build.py readme       # run one stage (and its deps)
+"""
+
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+STATE_FILE = ROOT / ".build_cache" / "build_state.json"
+PY = sys.executable or "python3"
+
+# Stage table: name -> {cmd, inputs, outputs, deps[, version]}
+# inputs/outputs are paths or glob patterns relative to ROOT. `version` is an
+# optional command whose output joins the fingerprint (tool upgrades rebuild).
+STAGES = {
+    "frontmatter": {
+        "cmd": [PY, "scripts/add_frontmatter.py"],
+        "inputs": ["scripts/add_frontmatter.py", "content/posts/**/*.md"],
+        "outputs": [],
+        "deps": [],
+    },
+    "mermaid": {
+        "cmd": [PY, "scripts/vendor_mermaid.py"],
+        "inputs": ["scripts/vendor_mermaid.py", "hugo.yaml"],
+        "outputs": ["static/js/mermaid-*.min.js"],
+        "deps": [],
+    },
+    "readme": {
+        "cmd": [PY, "scripts/update_readme.py", "--write"],
+        "inputs": ["scripts/update_readme.py", "content/posts/**/*.md"],
+        "outputs": ["README.md"],
+        "deps": ["frontmatter"],
+    },
+    "interview": {
+        "cmd": [PY, "scripts/split_interview.py", "--write"],
+        "inputs": [
+            "scripts/split_interview.py",
+            "scripts/add_frontmatter.py",
+            "content/posts/interview/*.md",
+        ],
+        "outputs": ["content/interview/_index.md", "static/interview/index.json"],
+        "deps": ["frontmatter"],
+    },
+    "hugo": {
+        "cmd": ["hugo", "--minify", "--buildFuture", "--cleanDestinationDir"],
+        "inputs": [
+            "hugo.yaml",
+            "archetypes/**/*",
+            "assets/**/*",
+            "content/**/*",
+            "layouts/**/*",
+            "static/**/*",
+            "themes/PaperMod/**/*",
+        ],
+        "outputs": ["public/index.html"],
+        "deps": ["frontmatter", "mermaid", "interview"],
+        "version": ["hugo", "version"],
+    },
+    "budget": {
+        "cmd": [
+            PY, "scripts/page_budget.py",
+            "--baseline", ".build_cache/page_budget_baseline.json",
+            "--save-baseline", ".build_cache/page_budget_baseline.json",
+        ],
+        # public/ is Hugo's output until precompress rewrites it, so track
+        # the hugo stage fingerprint (see fingerprint) instead of the files
+        "inputs": ["scripts/page_budget.py"],
+        "outputs": [],
+        "deps": ["hugo"],
+    },
+    "precompress": {
+        "cmd": [PY, "scripts/precompress.py"],
+        "inputs": ["scripts/precompress.py", "public/**/*"],
+        "outputs": [],
+        "deps": ["budget"],
+    },
+}
+
+
+def expand(patterns):
+    """Expand glob patterns into a sorted list of files relative to ROOT."""
+    files = set()
+    for pat in patterns:
+        for p in ROOT.glob(pat):
+            if p.is_file():
+                files.add(p.relative_to(ROOT).as_posix())
+    return sorted(files)
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def tool_version(cmd):
+    """Return the output of a version command, or "" if it cannot run."""
+    if shutil.which(cmd[0]) is None:
+        return ""
+    result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def fingerprint(stage, state):
+    """Hash the stage command, tool version, dependency fingerprints and the
+    path + content of every input file."""
+    h = hashlib.sha256()
+    h.update(json.dumps(stage["cmd"][1:]).encode())
+    for dep in stage["deps"]:
+        h.update(str(state.get(dep)).encode())
+    if "version" in stage:
+        h.update(tool_version(stage["version"]).encode())
+    for rel in expand(stage["inputs"]):
+        h.update(rel.encode())
+        h.update(file_digest(ROOT / rel).encode())
+    return h.hexdigest()
+
+
+def outputs_exist(stage):
+    return all(any(ROOT.glob(out)) for out in stage["outputs"])
+
+
+def load_state():
+    if STATE_FILE.exists():
+        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_state(state):
+    STATE_FILE.parent.mkdir(exist_ok=True)
+    STATE_FILE.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def select_stages(targets):
+    """Return the requested stages plus their transitive dependencies."""
+    if not targets:
+        return list(STAGES)
+    selected = []
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in STAGES:
+            raise SystemExit(f"Unknown stage: {name} (known: {', '.join(STAGES)})")
+        if name in selected:
+            continue
+        selected.append(name)
+        stack.extend(STAGES[name]["deps"])
+    return [name for name in STAGES if name in selected]
+
+
+def check_acyclic(names):
+    """Raise if the dependency graph restricted to names has a cycle."""
+    visiting, done = set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise SystemExit(f"Dependency cycle at stage: {name}")
+        visiting.add(name)
+        for dep in STAGES[name]["deps"]:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in names:
+        visit(name)
+
+
+def run_stage(name):
+    """Run one stage command; return (returncode, output, seconds)."""
+    cmd = STAGES[name]["cmd"]
+    if shutil.which(cmd[0]) is None:
+        return 127, f"command not found: {cmd[0]}\n", 0.0
+    start = time.monotonic()
+    result = subprocess.run(
+        cmd, cwd=ROOT, capture_output=True, text=True,
+    )
+    return result.returncode, result.stdout + result.stderr, time.monotonic() - start
+
+
+def build(names, force=False, dry_run=False):
+    """Execute stages in dependency order; return the number of failures."""
+    state = load_state()
+    pending = list(names)
+    done, failed = set(), set()
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, len(names))) as pool:
+        while pending or running:
+            for name in list(pending):
+                deps = [d for d in STAGES[name]["deps"] if d in names]
+                if any(d in failed for d in deps):
+                    print(f"[{name}] SKIP (dependency failed)")
+                    failed.add(name)
+                    pending.remove(name)
+                    continue
+                if not all(d in done for d in deps):
+                    continue
+                pending.remove(name)
+
+                stage = STAGES[name]
+                fp = fingerprint(stage, state)
+                if not force and state.get(name) == fp and outputs_exist(stage):
+                    print(f"[{name}] up to date")
+                    done.add(name)
+                    continue
+                if dry_run:
+                    print(f"[{name}] would run: {' '.join(stage['cmd'])}")
+                    # Placeholder so dependents see a changed fingerprint;
+                    # dry runs never save state
+                    state[name] = f"would-run:{fp}"
+                    done.add(name)
+                    continue
+                print(f"[{name}] running: {' '.join(stage['cmd'])}")
+                running[pool.submit(run_stage, name)] = name
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                name = running.pop(fut)
+                code, output, secs = fut.result()
+                for line in output.rstrip().splitlines():
+                    print(f"  [{name}] {line}")
+                if code == 0:
+                    # Fingerprint after the run: stages may rewrite their inputs
+                    state[name] = fingerprint(STAGES[name], state)
+                    save_state(state)
+                    print(f"[{name}] OK ({secs:.1f}s)")
+                    done.add(name)
+                else:
+                    print(f"[{name}] FAIL (exit {code})")
+                    failed.add(name)
+
+    return len(failed)
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    names = select_stages(args)
+    check_acyclic(names)
+    fail = build(names, force="--force" in sys.argv, dry_run="--dry-run" in sys.argv)
+    if fail:
+        print(f"\nBuild failed: {fail} stage(s) failed or skipped")
+        sys.exit(1)
+    print("\nBuild done")
+
+
+if __name__ == "__main__":
+    main()
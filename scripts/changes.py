@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Detect changed posts from git blob hashes instead of file mtimes.
+
+A fresh CI checkout gives every file a new mtime, so stat-based skipping
+sees the whole tree as changed. This reads blob hashes for the entire tree
+with one `git ls-files -s` call and diffs them against a per-consumer
+manifest saved after that consumer's last successful run.
+
+Renames are paired when a deleted and an added path have the same blob, or
+the same file name in another directory (reclassify.py moves posts with
+`git mv` and edits their categories, which changes the blob).
+
+Hashes come from the git index, so local edits count once they are staged.
+
+Library use:
+    changes, current = detect_changes("readme")
+    ...                                   # process changes
+    commit_manifest("readme", current)    # only after success
+
+Usage (from repo root):
+    python3 scripts/changes.py [name]           # show changes since last run
+    python3 scripts/changes.py [name] --commit  # and record the current state
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path, PurePosixPath
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_DIR = ROOT / ".build_cache"
+POSTS_PREFIX = "content/posts/"
+
+
+def ls_files(prefix=POSTS_PREFIX, suffix=".md"):
+    """Return {path relative to ROOT: blob hash} for tracked files."""
+    result = subprocess.run(
+        ["git", "ls-files", "-s", "-z", "--", prefix],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    blobs = {}
+    for entry in result.stdout.split("\0"):
+        if not entry:
+            continue
+        meta, path = entry.split("\t", 1)
+        _mode, sha, _stage = meta.split()
+        if path.endswith(suffix):
+            blobs[path] = sha
+    return blobs
+
+
+def manifest_path(name):
+    return MANIFEST_DIR / f"git_manifest_{name}.json"
+
+
+def load_manifest(name):
+    path = manifest_path(name)
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {}
+
+
+def commit_manifest(name, current):
+    """Record `current` as the state of the last successful run of `name`."""
+    MANIFEST_DIR.mkdir(exist_ok=True)
+    manifest_path(name).write_text(json.dumps(current, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def diff_manifests(old, new):
+    """Return {"added", "modified", "deleted": [paths], "renamed": {old: new}}."""
+    added = sorted(p for p in new if p not in old)
+    deleted = sorted(p for p in old if p not in new)
+    modified = sorted(p for p in new if p in old and new[p] != old[p])
+    renamed = {}
+
+    # Exact renames: same blob under a new path
+    by_blob = {}
+    for p in added:
+        by_blob.setdefault(new[p], []).append(p)
+    for p in list(deleted):
+        candidates = by_blob.get(old[p])
+        if candidates:
+            target = candidates.pop(0)
+            renamed[p] = target
+            deleted.remove(p)
+            added.remove(target)
+
+    # Moved and edited: same file name in another directory
+    by_name = {}
+    for p in added:
+        by_name.setdefault(PurePosixPath(p).name, []).append(p)
+    for p in list(deleted):
+        candidates = by_name.get(PurePosixPath(p).name)
+        if candidates and len(candidates) == 1:
+            target = candidates.pop()
+            renamed[p] = target
+            deleted.remove(p)
+            added.remove(target)
+            modified.append(target)
+
+    return {
+        "added": added,
+        "modified": sorted(modified),
+        "deleted": deleted,
+        "renamed": renamed,
+    }
+
+
+def detect_changes(name, prefix=POSTS_PREFIX):
+    """Return (changes, current blob map) for consumer `name`."""
+    current = ls_files(prefix)
+    return diff_manifests(load_manifest(name), current), current
+
+
+def has_changes(changes):
+    return any(changes[k] for k in ("added", "modified", "deleted", "renamed"))
+
+
+def changed_paths(changes):
+    """Paths that exist now and need processing: added, modified, rename targets."""
+    return sorted(set(changes["added"]) | set(changes["modified"]) | set(changes["renamed"].values()))
+
+
+def rename_keys(log, renamed, base=POSTS_PREFIX):
+    """Move resume-log entries keyed by path relative to `base` to renamed paths.
+
+    Returns the number of entries moved.
+    """
+    moved = 0
+    for old, new in renamed.items():
+        old_key, new_key = old[len(base):], new[len(base):]
+        if old_key in log and new_key not in log:
+            log[new_key] = log.pop(old_key)
+            moved += 1
+    return moved
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    name = args[0] if args else "default"
+    changes, current = detect_changes(name)
+    print(f"Tracked posts: {len(current)}")
+    for kind in ("added", "modified", "deleted"):
+        for p in changes[kind]:
+            print(f"  {kind[0].upper()}  {p}")
+    for old, new in sorted(changes["renamed"].items()):
+        print(f"  R  {old} -> {new}")
+    if not has_changes(changes):
+        print("  (no changes)")
+    if "--commit" in sys.argv:
+        commit_manifest(name, current)
+        print(f"Manifest saved: {manifest_path(name).relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Small helpers shared by the build scripts: argv values and self-tests.
+
+Scripts parse flags with `"--flag" in sys.argv`; arg_value() reads the
+value following a flag. Scripts with a --self-test mode build a list of
+(name, ok) checks and hand it to run_checks().
+"""
+
+import sys
+
+
+def arg_value(flag):
+    """Return the value following flag in argv, or None."""
+    if flag in sys.argv:
+        i = sys.argv.index(flag)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return None
+
+
+def run_checks(checks):
+    """Print each (name, ok) check; exit 1 if any failed."""
+    for name, ok in checks:
+        print(f"  {'OK  ' if ok else 'FAIL'} {name}")
+    if not all(ok for _, ok in checks):
+        sys.exit(1)
+    print("Self-test passed")
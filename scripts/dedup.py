@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Find near-duplicate articles with MinHash + LSH.
+
+Each article (front matter stripped) is tokenized CJK-aware: every CJK
+character is one token, runs of Latin letters/digits are one lowercase
+token. Shingles of SHINGLE_SIZE tokens are hashed, MinHash signatures for
+the whole corpus are computed in one vectorized NumPy pass, and LSH banding
+(sized from the threshold) yields candidate pairs without comparing every
+pair. Candidates are then scored by exact Jaccard similarity and their
+overlapping sections listed.
+
+Usage (from repo root):
+    python3 scripts/dedup.py                    # content/posts + interview/
+    python3 scripts/dedup.py --threshold 0.3    # report looser matches
+    python3 scripts/dedup.py path/a.md dir/     # explicit files/directories
+"""
+
+import re
+import sys
+import zlib
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PATHS = [ROOT / "content" / "posts", ROOT / "interview"]
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+# LSH banding (bands x rows = NUM_PERM) is derived from --threshold: the
+# most rows per band whose candidate recall 1-(1-J^rows)^bands at the
+# threshold is still at least MIN_RECALL. Fewer rows means more candidates.
+MIN_RECALL = 0.95
+PERM_BLOCK = 8  # permutations hashed per NumPy step, bounds memory use
+SEED = 1
+THRESHOLD = 0.5
+SECTION_THRESHOLD = 0.5
+MAX_SECTIONS = 5
+
+TOKEN_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]|[A-Za-z0-9_]+")
+FRONTMATTER_RE = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
+HEADING_RE = re.compile(r"^#{1,4}\s+(.+?)\s*$", re.MULTILINE)
+
+
+def tokenize(text):
+    return [t.lower() for t in TOKEN_RE.findall(text)]
+
+
+def shingles(text):
+    """Return the set of 32-bit shingle hashes for a piece of text."""
+    tokens = tokenize(text)
+    if len(tokens) < SHINGLE_SIZE:
+        return {zlib.crc32(" ".join(tokens).encode())} if tokens else set()
+    return {
+        zlib.crc32(" ".join(tokens[i:i + SHINGLE_SIZE]).encode())
+        for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    }
+
+
+def split_sections(text):
+    """Split markdown into [(heading, body)] on #..#### headings."""
+    sections = []
+    matches = list(HEADING_RE.finditer(text))
+    if not matches or matches[0].start() > 0:
+        end = matches[0].start() if matches else len(text)
+        sections.append(("(intro)", text[:end]))
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        sections.append((m.group(1), text[m.end():end]))
+    return sections
+
+
+def load_documents(paths):
+    """Return [(relative path, body text)] for every markdown file under paths."""
+    files = []
+    for p in paths:
+        p = Path(p).resolve()
+        if p.is_dir():
+            files.extend(sorted(p.rglob("*.md")))
+        elif p.suffix == ".md":
+            files.append(p)
+    docs = []
+    for f in files:
+        if f.name == "_index.md":
+            continue
+        text = FRONTMATTER_RE.sub("", f.read_text(encoding="utf-8"), count=1)
+        rel = f.relative_to(ROOT).as_posix() if f.is_relative_to(ROOT) else str(f)
+        docs.append((rel, text))
+    return docs
+
+
+def minhash_signatures(shingle_sets):
+    """Compute a (num_docs, NUM_PERM) MinHash matrix in one vectorized pass.
+
+    All shingle hashes are concatenated into one array; each permutation is
+    a multiply-shift hash h -> (a*h + b) >> 32 over uint64 (a odd), and the
+    per-document minimum is taken with np.minimum.reduceat.
+    """
+    sizes = np.array([len(s) for s in shingle_sets], dtype=np.int64)
+    empty = sizes == 0
+    flat = np.concatenate([
+        np.fromiter(s, dtype=np.uint64, count=len(s)) if s else np.zeros(1, dtype=np.uint64)
+        for s in shingle_sets
+    ])
+    offsets = np.concatenate(([0], np.cumsum(np.maximum(sizes, 1))[:-1]))
+
+    rng = np.random.default_rng(SEED)
+    a = rng.integers(1, 2**63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, size=NUM_PERM, dtype=np.uint64)
+
+    sig = np.empty((len(shingle_sets), NUM_PERM), dtype=np.uint32)
+    with np.errstate(over="ignore"):
+        for start in range(0, NUM_PERM, PERM_BLOCK):
+            stop = min(start + PERM_BLOCK, NUM_PERM)
+            hashed = (a[start:stop, None] * flat[None, :] + b[start:stop, None]) >> np.uint64(32)
+            sig[:, start:stop] = np.minimum.reduceat(hashed, offsets, axis=1).T.astype(np.uint32)
+    sig[empty] = np.iinfo(np.uint32).max
+    return sig
+
+
+def band_recall(similarity, bands, rows):
+    """Probability that a pair with this Jaccard similarity becomes a candidate."""
+    return 1.0 - (1.0 - similarity ** rows) ** bands
+
+
+def choose_banding(threshold):
+    """Return (bands, rows, recall at threshold) for the given threshold."""
+    options = [(NUM_PERM // rows, rows) for rows in range(NUM_PERM, 0, -1) if NUM_PERM % rows == 0]
+    for bands, rows in options:
+        recall = band_recall(threshold, bands, rows)
+        if recall >= MIN_RECALL:
+            return bands, rows, recall
+    bands, rows = options[-1]
+    return bands, rows, band_recall(threshold, bands, rows)
+
+
+def lsh_candidates(sig, bands, rows):
+    """Return candidate (i, j) pairs that share at least one LSH band."""
+    pairs = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        block = np.ascontiguousarray(sig[:, band * rows:(band + 1) * rows])
+        for doc, row in enumerate(block):
+            buckets[row.tobytes()].append(doc)
+        for members in buckets.values():
+            if len(members) > 1:
+                pairs.update(combinations(members, 2))
+    return sorted(pairs)
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def overlapping_sections(text_a, text_b):
+    """Return [(similarity, heading a, heading b)] for matching sections."""
+    secs_a = [(h, shingles(body)) for h, body in split_sections(text_a)]
+    secs_b = [(h, shingles(body)) for h, body in split_sections(text_b)]
+    matches = []
+    for ha, sa in secs_a:
+        if len(sa) < SHINGLE_SIZE:
+            continue
+        best = max(((jaccard(sa, sb), hb) for hb, sb in secs_b), default=(0.0, ""))
+        if best[0] >= SECTION_THRESHOLD:
+            matches.append((best[0], ha, best[1]))
+    matches.sort(reverse=True)
+    return matches
+
+
+def find_duplicates(docs, threshold, bands, rows):
+    """Return [(jaccard, minhash estimate, i, j)] above threshold, best first."""
+    shingle_sets = [shingles(text) for _, text in docs]
+    sig = minhash_signatures(shingle_sets)
+    results = []
+    for i, j in lsh_candidates(sig, bands, rows):
+        score = jaccard(shingle_sets[i], shingle_sets[j])
+        if score >= threshold:
+            estimate = float(np.mean(sig[i] == sig[j]))
+            results.append((score, estimate, i, j))
+    results.sort(reverse=True)
+    return results
+
+
+def main():
+    threshold = THRESHOLD
+    paths = []
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg == "--threshold":
+            value = next(args, None)
+            try:
+                threshold = float(value)
+            except (TypeError, ValueError):
+                threshold = None
+            if threshold is None or not 0.0 < threshold <= 1.0:
+                got = "no value" if value is None else repr(value)
+                print(f"ERROR: --threshold must be a number in (0, 1], got {got}")
+                sys.exit(1)
+        else:
+            paths.append(arg)
+
+    bands, rows, recall = choose_banding(threshold)
+
+    docs = load_documents(paths or DEFAULT_PATHS)
+    print(f"Scanned {len(docs)} articles")
+    print(f"LSH: {bands} bands x {rows} rows, candidate recall at Jaccard {threshold}: {recall:.1%}")
+    if recall < MIN_RECALL:
+        print(f"[WARN] threshold {threshold} is below what {NUM_PERM} permutations can band "
+              f"reliably, some pairs at that similarity will be missed")
+    results = find_duplicates(docs, threshold, bands, rows)
+    if not results:
+        print(f"No near-duplicates at Jaccard >= {threshold}")
+        return
+
+    print(f"Near-duplicate pairs (Jaccard >= {threshold}): {len(results)}\n")
+    for score, estimate, i, j in results:
+        (path_a, text_a), (path_b, text_b) = docs[i], docs[j]
+        print(f"{score:.2f} (minhash {estimate:.2f})  {path_a}  <->  {path_b}")
+        sections = overlapping_sections(text_a, text_b)
+        for sim, ha, hb in sections[:MAX_SECTIONS]:
+            print(f"    {sim:.2f}  {ha}  ~  {hb}")
+        if len(sections) > MAX_SECTIONS:
+            print(f"    ... {len(sections) - MAX_SECTIONS} more overlapping sections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+document.documentElement.classList.add("js");
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Report per-page weight and render cost of the built site and enforce budgets.
+
+Walks Hugo's public/ output and, for every HTML page, measures HTML bytes,
+local CSS/JS bytes (linked + inline), external script count, Mermaid and
+code block counts, and a DOM node estimate (number of opening tags).
+
+Usage (from repo root, after `hugo`):
+    python3 scripts/page_budget.py                          # report + check budgets
+    python3 scripts/page_budget.py --budgets budgets.json   # override budgets
+    python3 scripts/page_budget.py --baseline base.json     # also fail on regressions
+    python3 scripts/page_budget.py --save-baseline base.json
+    python3 scripts/page_budget.py --baseline base.json --save-baseline base.json --accept
+    python3 scripts/page_budget.py --public path/to/public  # check another tree
+    python3 scripts/page_budget.py --self-test              # check against fixtures
+
+Exits with status 1 when any page exceeds a budget, or regresses against
+the baseline. A metric regresses when it grows by more than
+REGRESSION_TOLERANCE and by at least its MIN_DELTA, either on one page or
+summed over the pages present in both runs (catches template changes that
+add a little to every page).
+
+--save-baseline only writes when the check passes, so passing it together
+with --baseline on the same file ratchets the baseline forward build by
+build. --accept (or PAGE_BUDGET_ACCEPT=1, set by the workflow's manual
+"accept_budget" run) reports regressions without failing and saves the
+new baseline; hard budgets still fail.
+"""
+
+import json
+import os
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+from cli import arg_value, run_checks
+
+ROOT = Path(__file__).resolve().parent.parent
+PUBLIC_DIR = ROOT / "public"
+HUGO_CONFIG = ROOT / "hugo.yaml"
+FIXTURES_DIR = ROOT / "scripts" / "fixtures"
+FIXTURE_BASE_URL = "https://deguiliu.github.io/tech-notes/"
+
+# Per-page budgets; a page over any of these fails the check.
+BUDGETS = {
+    "html_bytes": 400_000,
+    "css_bytes": 120_000,
+    "js_bytes": 150_000,
+    "external_scripts": 1,
+    "mermaid_blocks": 15,
+    "code_blocks": 120,
+    "dom_nodes": 20_000,
+}
+
+# Allowed growth per metric before a page counts as a regression
+REGRESSION_TOLERANCE = 0.10
+
+# Growth below these absolute amounts is never a regression, so normal
+# edits (one more diagram, a new section) do not fail the build
+MIN_DELTA = {
+    "html_bytes": 20_000,
+    "css_bytes": 10_000,
+    "js_bytes": 10_000,
+    "external_scripts": 1,
+    "mermaid_blocks": 5,
+    "code_blocks": 20,
+    "dom_nodes": 2_000,
+}
+
+TOP_N = 10
+
+
+def read_base_url():
+    """Read baseURL from hugo.yaml without pulling in a YAML parser."""
+    text = HUGO_CONFIG.read_text(encoding="utf-8")
+    m = re.search(r'^baseURL:\s*"?([^"\s]+)"?', text, re.MULTILINE)
+    return m.group(1) if m else "/"
+
+
+class PageScanner(HTMLParser):
+    """Collect the per-page counters from a single HTML document."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.dom_nodes = 0
+        self.stylesheets = []
+        self.scripts = []
+        self.inline_css = 0
+        self.inline_js = 0
+        self.mermaid_blocks = 0
+        self.code_blocks = 0
+        self._in = None
+
+    def handle_starttag(self, tag, attrs):
+        self.dom_nodes += 1
+        a = dict(attrs)
+        classes = (a.get("class") or "").split()
+        if tag == "link" and "stylesheet" in (a.get("rel") or "").split() and a.get("href"):
+            self.stylesheets.append(a["href"])
+        elif tag == "script":
+            if a.get("src"):
+                self.scripts.append(a["src"])
+            else:
+                self._in = "script"
+        elif tag == "style":
+            self._in = "style"
+        elif tag == "pre":
+            if "mermaid" in classes:
+                self.mermaid_blocks += 1
+            else:
+                self.code_blocks += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self._in = None
+
+    def handle_data(self, data):
+        if self._in == "script":
+            self.inline_js += len(data.encode("utf-8"))
+        elif self._in == "style":
+            self.inline_css += len(data.encode("utf-8"))
+
+
+def resolve_local(url, page_url, base, public):
+    """Map an asset URL to a file under public/, or None if it is external."""
+    absolute = urlparse(urljoin(page_url, url))
+    if absolute.netloc and absolute.netloc != base.netloc:
+        return None
+    path = absolute.path
+    if path.startswith(base.path):
+        path = path[len(base.path):]
+    return public / path.lstrip("/")
+
+
+def asset_size(path, cache):
+    if path not in cache:
+        cache[path] = path.stat().st_size if path and path.is_file() else 0
+    return cache[path]
+
+
+def scan_page(html_path, public, base_url, size_cache):
+    """Return the metrics dict for one HTML page."""
+    raw = html_path.read_bytes()
+    scanner = PageScanner()
+    scanner.feed(raw.decode("utf-8", errors="replace"))
+    scanner.close()
+
+    base = urlparse(base_url)
+    rel = html_path.relative_to(public).as_posix()
+    page_url = urljoin(base_url, rel)
+
+    css = scanner.inline_css
+    for href in scanner.stylesheets:
+        local = resolve_local(href, page_url, base, public)
+        if local is not None:
+            css += asset_size(local, size_cache)
+
+    js = scanner.inline_js
+    external = 0
+    for src in scanner.scripts:
+        local = resolve_local(src, page_url, base, public)
+        if local is None:
+            external += 1
+        else:
+            js += asset_size(local, size_cache)
+
+    return {
+        "html_bytes": len(raw),
+        "css_bytes": css,
+        "js_bytes": js,
+        "external_scripts": external,
+        "mermaid_blocks": scanner.mermaid_blocks,
+        "code_blocks": scanner.code_blocks,
+        "dom_nodes": scanner.dom_nodes,
+    }
+
+
+def scan_site(public, base_url):
+    """Return {relative page path: metrics} for every HTML file in public/."""
+    pages = {}
+    size_cache = {}
+    for html_path in sorted(public.rglob("*.html")):
+        rel = html_path.relative_to(public).as_posix()
+        pages[rel] = scan_page(html_path, public, base_url, size_cache)
+    return pages
+
+
+def check_budgets(pages, budgets):
+    violations = []
+    for rel, metrics in pages.items():
+        for key, limit in budgets.items():
+            if metrics.get(key, 0) > limit:
+                violations.append(f"{rel}: {key}={metrics[key]} > budget {limit}")
+    return violations
+
+
+def regressed(key, prev, value, tolerance):
+    delta = value - prev
+    return delta >= MIN_DELTA.get(key, 1) and delta > prev * tolerance
+
+
+def check_regressions(pages, baseline, tolerance):
+    """Compare each page, then site-wide totals over pages in both runs."""
+    regressions = []
+    common = [rel for rel in pages if rel in baseline]
+    totals_prev, totals_now = {}, {}
+    for rel in common:
+        for key, value in pages[rel].items():
+            prev = baseline[rel].get(key, 0)
+            totals_prev[key] = totals_prev.get(key, 0) + prev
+            totals_now[key] = totals_now.get(key, 0) + value
+            if regressed(key, prev, value, tolerance):
+                regressions.append(f"{rel}: {key} {prev} -> {value}")
+    for key, value in totals_now.items():
+        if regressed(key, totals_prev[key], value, tolerance):
+            regressions.append(f"site total ({len(common)} pages): {key} {totals_prev[key]} -> {value}")
+    return regressions
+
+
+def print_report(pages):
+    print(f"Pages scanned: {len(pages)}")
+    if not pages:
+        return
+    for key in BUDGETS:
+        total = sum(m[key] for m in pages.values())
+        worst = max(pages, key=lambda r: pages[r][key])
+        print(f"  {key:18s} total={total:<10d} max={pages[worst][key]:<8d} ({worst})")
+
+    print(f"\nTop {TOP_N} pages by HTML size:")
+    print(f"  {'html':>8s} {'css':>8s} {'js':>8s} {'ext':>3s} {'mmd':>3s} {'code':>4s} {'dom':>6s}  page")
+    heaviest = sorted(pages, key=lambda r: pages[r]["html_bytes"], reverse=True)[:TOP_N]
+    for rel in heaviest:
+        m = pages[rel]
+        print(
+            f"  {m['html_bytes']:8d} {m['css_bytes']:8d} {m['js_bytes']:8d} "
+            f"{m['external_scripts']:3d} {m['mermaid_blocks']:3d} "
+            f"{m['code_blocks']:4d} {m['dom_nodes']:6d}  {rel}"
+        )
+
+
+def self_test():
+    """Scan the checked-in sample tree and compare with recorded results."""
+    pages = scan_site(FIXTURES_DIR / "public", FIXTURE_BASE_URL)
+    expected = json.loads((FIXTURES_DIR / "page_budget_expected.json").read_text(encoding="utf-8"))
+    baseline = json.loads((FIXTURES_DIR / "page_budget_baseline.json").read_text(encoding="utf-8"))
+    tol = REGRESSION_TOLERANCE
+    run_checks([
+        ("metrics match page_budget_expected.json", pages == expected),
+        ("budget violation on posts/heavy/index.html",
+         check_budgets(pages, BUDGETS) == ["posts/heavy/index.html: external_scripts=2 > budget 1"]),
+        ("regressions against page_budget_baseline.json (js 40 -> 56 bytes is noise)",
+         check_regressions(pages, baseline, tol) == [
+             "posts/heavy/index.html: external_scripts 1 -> 2",
+             "site total (2 pages): external_scripts 1 -> 2",
+         ]),
+        ("no regression against itself", check_regressions(pages, pages, tol) == []),
+        ("first mermaid diagram is not a regression",
+         check_regressions({"p": {"mermaid_blocks": 1}}, {"p": {"mermaid_blocks": 0}}, tol) == []),
+        ("small growth on every page adds up in the site total",
+         check_regressions(
+             {f"p{i}": {"html_bytes": 11_000} for i in range(10)},
+             {f"p{i}": {"html_bytes": 9_000} for i in range(10)}, tol,
+         ) == ["site total (10 pages): html_bytes 90000 -> 110000"]),
+    ])
+
+
+def main():
+    if "--self-test" in sys.argv:
+        self_test()
+        return
+
+    public = Path(arg_value("--public") or PUBLIC_DIR)
+    if not public.is_dir():
+        print(f"ERROR: {public} not found, run hugo first")
+        sys.exit(1)
+
+    budgets = dict(BUDGETS)
+    budgets_file = arg_value("--budgets")
+    if budgets_file:
+        budgets.update(json.loads(Path(budgets_file).read_text(encoding="utf-8")))
+
+    pages = scan_site(public, read_base_url())
+    print_report(pages)
+
+    accept = "--accept" in sys.argv or os.environ.get("PAGE_BUDGET_ACCEPT") == "1"
+    failures = check_budgets(pages, budgets)
+    regressions = []
+    baseline_path = arg_value("--baseline")
+    if baseline_path and Path(baseline_path).exists():
+        baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+        regressions = check_regressions(pages, baseline, REGRESSION_TOLERANCE)
+    if accept and regressions:
+        print(f"\nAccepted regressions ({len(regressions)}):")
+        for r in regressions:
+            print(f"  {r}")
+    else:
+        failures += regressions
+
+    if failures:
+        print(f"\nBudget check FAILED ({len(failures)}):")
+        for f in failures:
+            print(f"  {f}")
+        sys.exit(1)
+    print("\nBudget check passed")
+
+    save_path = arg_value("--save-baseline")
+    if save_path:
+        Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(save_path).write_text(json.dumps(pages, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Baseline saved to {save_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Post-build stage: fingerprint static assets and precompress text files.
+
+1. Static subresources (CSS/JS/images/fonts) that are not fingerprinted yet
+   and are referenced by absolute URL from HTML/CSS get a content-hashed copy
+   (`name.<hash>.ext`), and those references are rewritten so they can be
+   cached long-term. The original file is kept for external links.
+2. Text assets get `.gz` and `.br` siblings, compressed in a process pool
+   into a content-addressed store under .build_cache and copied next to
+   each file. Hugo runs with --cleanDestinationDir, which deletes the
+   siblings, so unchanged content is restored from the store instead of
+   being compressed again. brotli is optional locally (only .gz is written
+   without it) but required when CI is set.
+
+Usage (from repo root, after `hugo`):
+    python3 scripts/precompress.py            # incremental
+    python3 scripts/precompress.py --force    # recompress everything
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz is written without it
+    brotli = None
+
+ROOT = Path(__file__).resolve().parent.parent
+PUBLIC_DIR = ROOT / "public"
+HUGO_CONFIG = ROOT / "hugo.yaml"
+STORE_DIR = ROOT / ".build_cache" / "compressed"  # <sha256>.gz / .br
+
+COMPRESS_EXTS = {".html", ".css", ".js", ".json", ".xml", ".svg", ".txt", ".map"}
+FINGERPRINT_EXTS = {
+    ".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg",
+    ".ico", ".woff", ".woff2",
+}
+REWRITE_EXTS = {".html", ".css"}
+MIN_SIZE = 1024  # smaller files are not worth compressing
+HASH_LEN = 10
+
+# Hugo Pipes fingerprints (stylesheet.<sha256>.css) and our own copies
+FINGERPRINTED_RE = re.compile(r"\.[0-9a-f]{%d,}\.[^.]+$" % HASH_LEN)
+
+
+def read_base_path():
+    """Return the URL path prefix of baseURL in hugo.yaml, e.g. /tech-notes/."""
+    text = HUGO_CONFIG.read_text(encoding="utf-8")
+    m = re.search(r'^baseURL:\s*"?https?://[^/"\s]+(/[^"\s]*)?"?', text, re.MULTILINE)
+    path = (m.group(1) if m else None) or "/"
+    return path if path.endswith("/") else path + "/"
+
+
+def digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def url_pattern(urls):
+    """Regex matching any of urls as a whole reference in HTML/CSS."""
+    return re.compile(
+        "(" + "|".join(re.escape(u) for u in sorted(urls, key=len, reverse=True)) + r")(?=[\"'()?#\s>]|$)"
+    )
+
+
+def text_files(public):
+    for path in public.rglob("*"):
+        if path.is_file() and path.suffix in REWRITE_EXTS:
+            yield path
+
+
+def referenced_urls(public, urls):
+    """Return the subset of urls that some HTML/CSS file references."""
+    if not urls:
+        return set()
+    pattern = url_pattern(urls)
+    found = set()
+    for path in text_files(public):
+        text = path.read_text(encoding="utf-8", errors="surrogateescape")
+        found.update(m.group(1) for m in pattern.finditer(text))
+    return found
+
+
+def fingerprint_assets(public, base_path):
+    """Copy referenced static assets to hashed names.
+
+    Only assets referenced by an absolute URL somewhere in HTML/CSS get a
+    copy (relative references are never rewritten). Returns
+    {old url path: new url path}.
+    """
+    planned = {}  # url -> (source path, hashed path, hashed url)
+    stale = {}  # url of a copy from an earlier version -> (path, hashed url)
+    for path in sorted(public.rglob("*")):
+        if not path.is_file() or path.suffix not in FINGERPRINT_EXTS:
+            continue
+        if FINGERPRINTED_RE.search(path.name):
+            continue
+        short = digest(path.read_bytes())[:HASH_LEN]
+        hashed = path.with_name(f"{path.stem}.{short}{path.suffix}")
+        new_url = base_path + hashed.relative_to(public).as_posix()
+        planned[base_path + path.relative_to(public).as_posix()] = (path, hashed, new_url)
+        own_copy = re.compile(
+            re.escape(path.stem) + r"\.[0-9a-f]{%d}" % HASH_LEN + re.escape(path.suffix)
+        )
+        for old in path.parent.glob(f"{path.stem}.*{path.suffix}"):
+            if old != hashed and own_copy.fullmatch(old.name):
+                stale[base_path + old.relative_to(public).as_posix()] = (old, new_url)
+
+    used = referenced_urls(public, list(planned) + list(stale))
+    mapping = {url: planned[url][2] for url in used if url in planned}
+    mapping.update({url: stale[url][1] for url in used if url in stale})
+    needed = set(mapping.values())
+    for path, hashed, new_url in planned.values():
+        if new_url in needed and not hashed.exists():
+            shutil.copyfile(path, hashed)
+    # Drop copies of earlier versions; pages using them are repointed via mapping
+    for old, _ in stale.values():
+        old.unlink()
+    return mapping
+
+
+def rewrite_references(public, mapping):
+    """Point absolute asset references in HTML/CSS at the hashed copies."""
+    if not mapping:
+        return 0
+    pattern = url_pattern(mapping)
+    changed = 0
+    for path in text_files(public):
+        text = path.read_text(encoding="utf-8", errors="surrogateescape")
+        new_text = pattern.sub(lambda m: mapping[m.group(1)], text)
+        if new_text != text:
+            path.write_text(new_text, encoding="utf-8", errors="surrogateescape")
+            changed += 1
+    return changed
+
+
+def encodings():
+    return (".gz", ".br") if brotli is not None else (".gz",)
+
+
+def stored(h):
+    """Store paths holding the compressed forms of content with hash h."""
+    return [STORE_DIR / f"{h}{ext}" for ext in encodings()]
+
+
+def compress_file(job):
+    """Compress one file into the store; return (path, gz size, br size)."""
+    path_str, h = job
+    data = Path(path_str).read_bytes()
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    (STORE_DIR / f"{h}.gz").write_bytes(gz)
+    br_size = 0
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        (STORE_DIR / f"{h}.br").write_bytes(br)
+        br_size = len(br)
+    return path_str, len(gz), br_size
+
+
+def main():
+    public = PUBLIC_DIR
+    if not public.is_dir():
+        print(f"ERROR: {public} not found, run hugo first")
+        sys.exit(1)
+    if brotli is None and os.environ.get("CI"):
+        print("ERROR: brotli module not installed (pip install -r scripts/requirements-ci.txt)")
+        sys.exit(1)
+    force = "--force" in sys.argv
+
+    mapping = fingerprint_assets(public, read_base_path())
+    rewritten = rewrite_references(public, mapping)
+    print(f"Fingerprinted assets: {len(mapping)} references mapped, {rewritten} files rewritten")
+
+    STORE_DIR.mkdir(parents=True, exist_ok=True)
+    files = []  # (path, content hash)
+    todo = []
+    for path in sorted(public.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESS_EXTS:
+            continue
+        if path.stat().st_size < MIN_SIZE:
+            continue
+        h = digest(path.read_bytes())
+        files.append((path, h))
+        if force or not all(p.exists() for p in stored(h)):
+            todo.append((str(path), h))
+
+    raw = gz_total = br_total = 0
+    if todo:
+        with ProcessPoolExecutor() as pool:
+            for path_str, gz_size, br_size in pool.map(compress_file, todo, chunksize=8):
+                raw += Path(path_str).stat().st_size
+                gz_total += gz_size
+                br_total += br_size
+
+    # Hugo's --cleanDestinationDir removes the siblings, so restore them
+    # from the store on every run
+    live = set()
+    for path, h in files:
+        for ext, src in zip(encodings(), stored(h)):
+            shutil.copyfile(src, f"{path}{ext}")
+            live.add(src.name)
+    for entry in STORE_DIR.iterdir():
+        if entry.name not in live:
+            entry.unlink()
+
+    print(f"Compressed {len(todo)} files, reused {len(files) - len(todo)} from {STORE_DIR.relative_to(ROOT)}")
+    if todo:
+        line = f"  {raw} bytes -> gzip {gz_total}"
+        if brotli is not None:
+            line += f", brotli {br_total}"
+        print(line)
+    if brotli is None:
+        print("  (brotli module not installed, .br files not written)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""Publish Hugo articles to several platforms from a single parse pass.
+
+Articles are collected and normalized once (upload_juejin.collect_articles),
+then dispatched concurrently to every selected target. Each target adapter
+owns its rate limit, tag mapping and resume journal, so a failure or slow
+API on one platform does not hold up the others.
+
+Usage (from repo root):
+    python3 scripts/publish.py                       # all configured targets
+    python3 scripts/publish.py --targets juejin      # comma-separated subset
+    python3 scripts/publish.py --dry-run             # list pending uploads
+    python3 scripts/publish.py --changed             # only posts changed in git since each
+                                                     # target's last successful run
+    python3 scripts/publish.py --self-test           # run against local stand-in servers
+
+Adding a platform means subclassing Target and registering it in TARGETS.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+import upload_juejin
+from changes import changed_paths, commit_manifest, detect_changes, rename_keys
+from cli import run_checks
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+class RateLimiter:
+    """Enforce a minimum interval between calls to one platform."""
+
+    def __init__(self, interval_sec):
+        self.interval = interval_sec
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next:
+                time.sleep(self._next - now)
+                now = self._next
+            self._next = now + self.interval
+
+
+class Journal:
+    """Per-target resume log: {article path: {"err_no": ..., ...}}."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries = {}
+        if self.path.exists():
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def done(self, key):
+        return self.entries.get(key, {}).get("err_no") == 0
+
+    def rename(self, renamed):
+        """Follow posts moved since the last run (see changes.rename_keys)."""
+        with self._lock:
+            if rename_keys(self.entries, renamed):
+                self.path.write_text(
+                    json.dumps(self.entries, ensure_ascii=False, indent=2), encoding="utf-8"
+                )
+
+    def record(self, key, entry):
+        with self._lock:
+            self.entries[key] = entry
+            self.path.write_text(
+                json.dumps(self.entries, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+
+
+class Target:
+    """Base adapter. Subclasses set name/delay_sec/tag_map and implement publish()."""
+
+    name = ""
+    delay_sec = 3
+    tag_map = None  # None passes Hugo tags through unchanged
+
+    def __init__(self, journal_dir=SCRIPTS_DIR):
+        self.limiter = RateLimiter(self.delay_sec)
+        self.journal = Journal(Path(journal_dir) / f"{self.name}_upload_log.json")
+
+    def missing_config(self):
+        """Return a message if the target cannot run, else None."""
+        return None
+
+    def map_tags(self, hugo_tags):
+        """Translate Hugo tags to platform tag names, dropping unknown ones."""
+        if self.tag_map is None:
+            return list(hugo_tags)
+        mapped = []
+        for t in hugo_tags:
+            name = self.tag_map.get(t)
+            if name and name not in mapped:
+                mapped.append(name)
+        return mapped
+
+    def publish(self, article):
+        """Upload one article; return a journal entry with err_no 0 on success."""
+        raise NotImplementedError
+
+
+class JuejinTarget(Target):
+    """juejin.cn drafts, via the existing upload_juejin helpers.
+
+    Shares juejin_upload_log.json with upload_juejin.py as its journal.
+    """
+
+    name = "juejin"
+    delay_sec = upload_juejin.DELAY_SEC
+    tag_map = upload_juejin.HUGO_TAG_MAP
+
+    def missing_config(self):
+        if not upload_juejin.COOKIE:
+            return "set JUEJIN_COOKIE env variable"
+        return None
+
+    def publish(self, article):
+        tag_ids = upload_juejin.resolve_tag_names(self.map_tags(article["hugo_tags"]))
+        result = upload_juejin.create_draft(article, tag_ids)
+        return {
+            "err_no": result.get("err_no", -1),
+            "data": result.get("data"),
+            "err_msg": result.get("err_msg"),
+        }
+
+
+class WebhookTarget(Target):
+    """POST the normalized article as JSON to PUBLISH_WEBHOOK_URL.
+
+    Generic bridge for platforms fronted by a small relay service.
+    """
+
+    name = "webhook"
+    delay_sec = float(os.environ.get("PUBLISH_WEBHOOK_DELAY", "1"))
+
+    def missing_config(self):
+        if not os.environ.get("PUBLISH_WEBHOOK_URL"):
+            return "set PUBLISH_WEBHOOK_URL env variable"
+        return None
+
+    def publish(self, article):
+        headers = {"content-type": "application/json"}
+        token = os.environ.get("PUBLISH_WEBHOOK_TOKEN")
+        if token:
+            headers["authorization"] = f"Bearer {token}"
+        payload = {
+            "path": article["path"],
+            "title": article["title"],
+            "summary": article["summary"],
+            "tags": self.map_tags(article["hugo_tags"]),
+            "categories": article["categories"],
+            "markdown": article["body"],
+        }
+        resp = requests.post(
+            os.environ["PUBLISH_WEBHOOK_URL"], headers=headers, json=payload, timeout=30
+        )
+        if not resp.ok:
+            return {"err_no": resp.status_code, "err_msg": resp.text[:200]}
+        # Relays are free to answer with plain text; the POST still succeeded
+        try:
+            data = resp.json() if resp.content else None
+        except ValueError:
+            data = resp.text[:200]
+        return {"err_no": 0, "data": data}
+
+
+TARGETS = {
+    "juejin": JuejinTarget,
+    "webhook": WebhookTarget,
+}
+
+
+def run_target(target, articles, dry_run=False):
+    """Publish all pending articles to one target; return (done, failed)."""
+    tag = f"[{target.name}]"
+    done = fail = 0
+    for i, art in enumerate(articles, 1):
+        key = art["path"]
+        if target.journal.done(key):
+            done += 1
+            continue
+        if dry_run:
+            print(f"{tag} [{i}/{len(articles)}] would upload: {art['title']}")
+            continue
+
+        target.limiter.wait()
+        print(f"{tag} [{i}/{len(articles)}] Uploading: {art['title']}")
+        try:
+            entry = target.publish(art)
+        except Exception as e:
+            entry = {"err_no": -1, "err_msg": str(e)}
+        if entry.get("err_no") == 0:
+            print(f"{tag}   OK")
+            done += 1
+        else:
+            print(f"{tag}   FAIL err_no={entry.get('err_no')} msg={entry.get('err_msg')}")
+            fail += 1
+        target.journal.record(key, entry)
+    return done, fail
+
+
+def select_targets():
+    names = list(TARGETS)
+    if "--targets" in sys.argv:
+        i = sys.argv.index("--targets")
+        names = sys.argv[i + 1].split(",") if i + 1 < len(sys.argv) else []
+    targets = []
+    for name in names:
+        if name not in TARGETS:
+            print(f"ERROR: unknown target '{name}' (known: {', '.join(TARGETS)})")
+            sys.exit(1)
+        target = TARGETS[name]()
+        problem = target.missing_config()
+        if problem:
+            print(f"[{name}] SKIP: {problem}")
+            continue
+        targets.append(target)
+    return targets
+
+
+def publish_all(targets, articles, dry_run=False):
+    """Run every target concurrently; return {target name: (done, failed)}."""
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        futures = {t.name: pool.submit(run_target, t, articles, dry_run) for t in targets}
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Local stand-in for a platform API; records every request it serves.
+
+    Set on a subclass: `respond(path, body) -> (status, content type, text)`.
+    """
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["content-length"])) or b"{}")
+        self.server.calls.append((time.monotonic(), self.path, body))
+        status, ctype, text = self.respond(self.path, body)
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", ctype)
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(respond):
+    handler = type("Handler", (StandIn,), {"respond": staticmethod(respond)})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.calls = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def self_test():
+    """Publish to stand-in juejin and webhook servers and check the results."""
+    interval = 0.3
+    attempts = {}
+
+    def juejin(path, body):
+        return 200, "application/json", json.dumps({"err_no": 0, "data": {"draft_id": body["title"]}})
+
+    def webhook(path, body):
+        # First attempt at "flaky" fails; "plain" answers with a non-JSON body
+        attempts[body["title"]] = attempts.get(body["title"], 0) + 1
+        if body["title"] == "flaky" and attempts["flaky"] == 1:
+            return 503, "text/plain", "busy"
+        if body["title"] == "plain":
+            return 200, "text/plain", "accepted"
+        return 200, "application/json", json.dumps({"id": body["path"]})
+
+    jj_server, jj_url = serve(juejin)
+    wh_server, wh_url = serve(webhook)
+    upload_juejin.COOKIE = "stand-in"
+    upload_juejin.API_CREATE_DRAFT = f"{jj_url}/content_api/v1/article_draft/create"
+    os.environ["PUBLISH_WEBHOOK_URL"] = f"{wh_url}/publish"
+    articles = [
+        {"path": f"test/{t}.md", "title": t, "summary": "s" * 150, "hugo_tags": ["RTOS"],
+         "categories": ["test"], "body": "# body"}
+        for t in ("plain", "flaky", "json")
+    ]
+
+    with tempfile.TemporaryDirectory() as journal_dir:
+        def make_targets():
+            targets = [JuejinTarget(journal_dir), WebhookTarget(journal_dir)]
+            for t in targets:
+                t.limiter = RateLimiter(interval)
+            return targets
+
+        first = publish_all(make_targets(), articles)
+        first_calls = (list(jj_server.calls), list(wh_server.calls))
+        second = publish_all(make_targets(), articles)
+        journals = {
+            name: json.loads((Path(journal_dir) / f"{name}_upload_log.json").read_text(encoding="utf-8"))
+            for name in TARGETS
+        }
+
+    def gaps(calls):
+        times = [c[0] for c in calls]
+        return [b - a for a, b in zip(times, times[1:])]
+
+    jj_server.shutdown()
+    wh_server.shutdown()
+    print()
+    run_checks([
+        ("fan-out: every article reached both targets", tuple(map(len, first_calls)) == (3, 3)),
+        ("failure isolated to its target", first == {"juejin": (3, 0), "webhook": (2, 1)}),
+        ("rate limit held per target",
+         min(gaps(first_calls[0]) + gaps(first_calls[1])) >= interval * 0.9),
+        ("non-JSON 2xx recorded as success", journals["webhook"]["test/plain.md"]
+         == {"err_no": 0, "data": "accepted"}),
+        ("journals resume: only the failed upload is retried",
+         (len(jj_server.calls), len(wh_server.calls)) == (3, 4)
+         and second == {"juejin": (3, 0), "webhook": (3, 0)}),
+        ("summary truncated for juejin only",
+         len(jj_server.calls[0][2]["brief_content"]) == 100
+         and len(wh_server.calls[0][2]["summary"]) == 150),
+        ("juejin tags go through map_tags (RTOS -> 嵌入式)",
+         jj_server.calls[0][2]["tag_ids"] == [upload_juejin.TAG_CACHE["嵌入式"]]),
+    ])
+
+
+def main():
+    if "--self-test" in sys.argv:
+        self_test()
+        return
+
+    dry_run = "--dry-run" in sys.argv
+    targets = select_targets()
+    if not targets:
+        print("ERROR: no configured targets")
+        sys.exit(1)
+
+    # One manifest per target: a target that was skipped, or failed, keeps
+    # seeing the posts changed since its own last successful run
+    current = None
+    if "--changed" in sys.argv:
+        paths = set()
+        for t in targets:
+            changes, current = detect_changes(f"publish-{t.name}")
+            t.journal.rename(changes["renamed"])
+            paths.update(changed_paths(changes))
+        articles = upload_juejin.collect_articles(sorted(paths))
+    else:
+        articles = upload_juejin.collect_articles()
+    print(f"Found {len(articles)} articles, targets: {', '.join(t.name for t in targets)}\n")
+
+    results = publish_all(targets, articles, dry_run)
+
+    print()
+    failed = 0
+    for name, (done, fail) in results.items():
+        print(f"{name}: {done} success, {fail} failed")
+        failed += fail
+        if current is not None and not dry_run and not fail:
+            commit_manifest(f"publish-{name}", current)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Split the interview question banks into per-topic pages and a JSON index.
+
+The banks under content/posts/interview/ are single 15-40 KB pages. This
+parses each bank into per-question records (topic, question, answer, tags;
+tags go through taxonomy.normalize like article tags) and generates:
+
+    content/interview/<bank>/part-N.md   one page per topic, at most
+                                         QUESTIONS_PER_PAGE questions each
+    content/interview/<bank>/appendix.md "附录" sections, if any
+    static/interview/index.json          compact index: question -> page#anchor
+
+Question anchors are stable (`#q7`). layouts/_default/index.json merges the
+question index into the site search index, so search results link straight
+to a question; the generated pages themselves carry no taxonomies and are
+hidden from search (the source banks stay searchable as full pages). The
+top-level interview/ directory holds identical copies of the same banks and
+is not used as a source.
+
+Usage (from repo root):
+    python3 scripts/split_interview.py          # preview
+    python3 scripts/split_interview.py --write  # write generated files
+"""
+
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from add_frontmatter import detect_tags, escape_yaml_string
+from taxonomy import normalize
+
+ROOT = Path(__file__).resolve().parent.parent
+BANK_DIR = ROOT / "content" / "posts" / "interview"
+OUT_DIR = ROOT / "content" / "interview"
+INDEX_FILE = ROOT / "static" / "interview" / "index.json"
+URL_PREFIX = "interview"  # index URLs are relative to baseURL
+
+QUESTIONS_PER_PAGE = 10
+SNIPPET_LEN = 120
+
+# slug -> source bank
+BANKS = {
+    "senior-embedded": "senior_embedded_software_engineer_interview_questions.md",
+    "embedded-c": "senior_embedded_c_language_interview_questions.md",
+}
+
+INDEX_PAGE = """\
+---
+title: "面试题库"
+description: "按主题拆分的嵌入式面试题，每页只包含一个主题"
+---
+"""
+
+QUESTION_RE = re.compile(r"^###\s+Q(\d+)[:：]\s*(.+?)\s*$")
+TOPIC_RE = re.compile(r"^##\s+(.+?)\s*$")
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+def fm_value(fm, key):
+    m = re.search(rf'^{key}:\s*"?(.*?)"?\s*$', fm, re.MULTILINE)
+    return m.group(1) if m else ""
+
+
+def plain(text):
+    """Strip common markdown markup for index snippets."""
+    text = re.sub(r"[*`>|]", "", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def parse_bank(text):
+    """Return (front matter dict, topics, appendix lines).
+
+    topics: [{"title": str, "questions": [{"number", "title", "question",
+    "lines"}]}]. "## 附录..." sections after the last question are
+    returned as appendix lines. Headings inside code fences are ignored.
+    """
+    m = FRONTMATTER_RE.match(text)
+    fm_text = m.group(1) if m else ""
+    body = text[m.end():] if m else text
+    meta = {
+        "title": fm_value(fm_text, "title"),
+        "date": fm_value(fm_text, "date"),
+    }
+
+    topics, appendix = [], []
+    current_q = None
+    in_fence = in_appendix = False
+    for line in body.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence:
+            tm = TOPIC_RE.match(line)
+            qm = QUESTION_RE.match(line)
+            if tm and not line.startswith("###"):
+                in_appendix = tm.group(1).startswith("附录")
+                current_q = None
+                if not in_appendix:
+                    topics.append({"title": tm.group(1), "questions": []})
+                    continue
+            elif qm and topics and not in_appendix:
+                current_q = {"number": int(qm.group(1)), "title": qm.group(2), "lines": []}
+                topics[-1]["questions"].append(current_q)
+                continue
+        if in_appendix:
+            appendix.append(line)
+        elif current_q is not None:
+            current_q["lines"].append(line)
+
+    for topic in topics:
+        for q in topic["questions"]:
+            # Drop the "---" separators between questions
+            while q["lines"] and q["lines"][-1].strip() in ("", "---"):
+                q["lines"].pop()
+            text = "\n".join(q["lines"])
+            qm = re.search(r"\*\*题目\*\*[:：]\s*(.+?)(?=\n\s*\n|\*\*答案提示\*\*|$)", text, re.DOTALL)
+            q["question"] = plain(qm.group(1)) if qm else q["title"]
+            q["tags"] = normalize(detect_tags(q["title"] + "\n" + text))
+    return meta, topics, appendix
+
+
+def paginate(topics):
+    """Yield (page slug, topic title, questions), splitting large topics."""
+    for n, topic in enumerate(topics, 1):
+        qs = topic["questions"]
+        chunks = [qs[i:i + QUESTIONS_PER_PAGE] for i in range(0, len(qs), QUESTIONS_PER_PAGE)] or [[]]
+        for k, chunk in enumerate(chunks, 1):
+            slug = f"part-{n}" if len(chunks) == 1 else f"part-{n}-{k}"
+            yield slug, topic["title"], chunk
+
+
+def page_header(title, meta, summary, weight):
+    return [
+        "---",
+        f'title: "{escape_yaml_string(title)}"',
+        f"date: {meta['date']}",
+        "draft: false",
+        "searchHidden: true",
+        f'summary: "{escape_yaml_string(summary[:200])}"',
+        f"weight: {weight}",
+        "ShowToc: true",
+        "TocOpen: true",
+        "---",
+        "",
+        "<!-- Generated by scripts/split_interview.py, do not edit -->",
+        "",
+    ]
+
+
+def render_page(bank_title, meta, topic_title, questions, weight):
+    first, last = questions[0]["number"], questions[-1]["number"]
+    summary = f"Q{first}-Q{last}: " + "; ".join(q["title"] for q in questions)
+    lines = page_header(f"{bank_title}: {topic_title}", meta, summary, weight)
+    for q in questions:
+        lines.append(f"## Q{q['number']}: {q['title']} {{#q{q['number']}}}")
+        lines.extend(q["lines"])
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def render_appendix(bank_title, meta, appendix, weight):
+    lines = page_header(f"{bank_title}: 附录", meta, "评分参考与核心概念速查", weight)
+    lines.extend(appendix)
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def generate():
+    """Return ({path: content}, index records)."""
+    files = {OUT_DIR / "_index.md": INDEX_PAGE}
+    records = []
+    for bank_slug, source in BANKS.items():
+        meta, topics, appendix = parse_bank((BANK_DIR / source).read_text(encoding="utf-8"))
+        bank_title = meta["title"].split(":")[0].strip()
+        files[OUT_DIR / bank_slug / "_index.md"] = (
+            f'---\ntitle: "{escape_yaml_string(meta["title"])}"\n'
+            f'description: "按主题拆分, 源文件: {escape_yaml_string(source)}"\n---\n'
+        )
+        pages = list(paginate(topics))
+        for weight, (slug, topic_title, questions) in enumerate(pages, 1):
+            if not questions:
+                continue
+            files[OUT_DIR / bank_slug / f"{slug}.md"] = render_page(
+                bank_title, meta, topic_title, questions, weight
+            )
+            for q in questions:
+                records.append({
+                    "id": f"{bank_slug}-q{q['number']}",
+                    "bank": bank_slug,
+                    "topic": topic_title,
+                    "title": f"Q{q['number']}: {q['title']}",
+                    "question": q["question"][:SNIPPET_LEN],
+                    "tags": q["tags"],
+                    "url": f"{URL_PREFIX}/{bank_slug}/{slug}/#q{q['number']}",
+                })
+        if any(l.strip() for l in appendix):
+            files[OUT_DIR / bank_slug / "appendix.md"] = render_appendix(
+                bank_title, meta, appendix, len(pages) + 1
+            )
+    return files, records
+
+
+def main():
+    files, records = generate()
+    index = json.dumps({"questions": records}, ensure_ascii=False, separators=(",", ":"))
+
+    if "--write" not in sys.argv:
+        for path, content in files.items():
+            print(f"{path.relative_to(ROOT)}  ({len(content.encode('utf-8'))} bytes)")
+        print(f"{INDEX_FILE.relative_to(ROOT)}  ({len(index.encode('utf-8'))} bytes, {len(records)} questions)")
+        print("\n--- Run with --write to generate files ---")
+        return
+
+    # Regenerate from scratch so removed topics do not leave stale pages
+    if OUT_DIR.exists():
+        shutil.rmtree(OUT_DIR)
+    for path, content in files.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    INDEX_FILE.write_text(index + "\n", encoding="utf-8")
+    print(f"Generated {len(files)} pages and {len(records)} index entries")
+
+
+if __name__ == "__main__":
+    main()
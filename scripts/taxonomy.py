@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Normalize article tags to a canonical taxonomy.
+
+Every distinct tag becomes its own Hugo taxonomy page, so spelling variants
+(`embedded` / `嵌入式`, `lidar` / `LiDAR`), language-standard variants
+(`C++17` / `C++`) and one-off tags inflate build time and output size.
+CANONICAL_TAGS maps each canonical tag to its aliases; canonical names
+follow the tags produced by add_frontmatter.TAG_RULES and the keys of
+HUGO_TAG_MAP. Standard-version tags that HUGO_TAG_MAP already merges into
+their base tag (C++11/14/17 -> C++) become aliases automatically. The
+coarser juejin groups (RTOS, MCU, Cortex-M -> 嵌入式) are not merged: they
+are distinct topics on the site, juejin just has no finer tag for them.
+
+Articles keep at most MAX_TAGS tags; extra ones are trimmed, keeping tags
+from TAG_RULES / CANONICAL_TAGS first, then the most used.
+
+Usage (from repo root):
+    python3 scripts/taxonomy.py                  # frequency report
+    python3 scripts/taxonomy.py --write          # rewrite aliases to canonical tags
+    python3 scripts/taxonomy.py --write --prune  # also drop single-use tags
+"""
+
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from add_frontmatter import TAG_RULES
+
+ROOT = Path(__file__).resolve().parent.parent
+POSTS_DIR = ROOT / "content" / "posts"
+
+MIN_TAGS = 2  # CONTRIBUTING.md: at least 2 tags per article
+MAX_TAGS = 8
+TOP_N = 30
+
+# canonical tag -> aliases
+CANONICAL_TAGS = {
+    "embedded": ["嵌入式"],
+    "bare-metal": ["裸机"],
+    "C": ["C11", "C99", "C语言"],
+    "Linux": ["linux"],
+    "LiDAR": ["lidar"],
+    "lock-free": ["无锁"],
+    "state-machine": ["状态机", "FSM"],
+    "performance": ["性能优化"],
+    "zero-allocation": ["zero-heap", "零堆分配"],
+    "memory-pool": ["内存池"],
+    "memory-management": ["内存管理", "memory-allocation"],
+    "memory-barrier": ["memory-fence"],
+    "ring-buffer": ["ringbuffer"],
+    "message-bus": ["消息队列"],
+    "architecture": ["架构设计", "系统设计"],
+    "concurrency": ["并发编程"],
+    "interview": ["面试"],
+    "template": ["模板"],
+    "compile-time": ["编译期多态"],
+    "scheduler": ["scheduling"],
+    "cooperative-scheduling": ["cooperative-multitasking"],
+    "serial": ["UART"],
+    "variant": ["std-variant"],
+    "protobuf": ["Protobuf"],
+    "SSH": ["ssh"],
+    "MISRA": ["MISRA-C"],
+    "QP/C": ["QPC"],
+}
+
+# Hugo tag -> juejin tag name (used by upload_juejin.py and publish.py)
+HUGO_TAG_MAP = {
+    "C++": "C++", "C++11": "C++", "C++14": "C++", "C++17": "C++",
+    "C": "C语言", "C11": "C语言", "C99": "C语言", "C语言": "C语言",
+    "embedded": "嵌入式", "嵌入式": "嵌入式",
+    "Linux": "Linux", "linux": "Linux", "ARM-Linux": "Linux",
+    "ARM": "嵌入式", "Cortex-M": "嵌入式", "MCU": "嵌入式",
+    "RTOS": "嵌入式", "RT-Thread": "嵌入式", "bare-metal": "嵌入式",
+    "performance": "性能优化", "性能优化": "性能优化",
+    "benchmark": "性能优化", "profiling": "性能优化",
+    "architecture": "架构", "架构设计": "架构",
+    "design-pattern": "设计模式",
+    "lock-free": "后端", "concurrency": "后端",
+    "message-bus": "消息队列", "消息队列": "消息队列",
+    "state-machine": "状态机", "FSM": "状态机", "HSM": "状态机",
+    "状态机": "状态机",
+}
+
+VERSION_RE = re.compile(r"^(.+?)\d+$")
+
+
+def version_aliases(tag_map):
+    """Return {versioned tag: base tag} for tags tag_map maps like their base."""
+    aliases = {}
+    for tag, target in tag_map.items():
+        m = VERSION_RE.match(tag)
+        if m and tag_map.get(m.group(1)) == target:
+            aliases[tag] = m.group(1)
+    return aliases
+
+
+# Tags emitted by add_frontmatter.py are canonical by definition
+KNOWN_TAGS = set(CANONICAL_TAGS) | {tag for _, tag in TAG_RULES}
+
+ALIASES = version_aliases(HUGO_TAG_MAP)
+ALIASES.update(
+    (alias, canonical)
+    for canonical, aliases in CANONICAL_TAGS.items()
+    for alias in aliases
+)
+
+TAGS_RE = re.compile(r"^tags:\s*\[(.*?)\]", re.MULTILINE)
+
+
+def canonical(tag):
+    return ALIASES.get(tag, tag)
+
+
+def parse_tags(text):
+    """Return the tag list from front matter, or None if there is no tags line."""
+    fm_end = text.find("---", 3)
+    m = TAGS_RE.search(text, 0, fm_end if fm_end > 0 else len(text))
+    if not m:
+        return None
+    return re.findall(r'"([^"]+)"', m.group(1))
+
+
+def normalize(tags, drop=(), counts=None):
+    """Map tags to canonical names, de-duplicate, and drop tags in `drop`
+    while keeping at least MIN_TAGS and at most MAX_TAGS (ranked by
+    KNOWN_TAGS membership, then by `counts`)."""
+    result = []
+    for t in tags:
+        c = canonical(t)
+        if c not in result:
+            result.append(c)
+    kept = [t for t in result if t not in drop]
+    if len(kept) < MIN_TAGS:
+        # Put back dropped tags, in their original order, up to the minimum
+        kept += [t for t in result if t in drop][:MIN_TAGS - len(kept)]
+        kept = [t for t in result if t in kept]
+    if len(kept) > MAX_TAGS:
+        counts = counts or {}
+        top = sorted(kept, key=lambda t: (t not in KNOWN_TAGS, -counts.get(t, 0)))[:MAX_TAGS]
+        kept = [t for t in kept if t in top]
+    return kept
+
+
+def prune(posts, usage):
+    """Normalize and drop single-use tags until the result is stable.
+
+    Dropping one round of single-use tags can leave other tags used only
+    once, so repeat until a pass changes nothing; running --prune again on
+    the output is then a no-op.
+    """
+    current = {path: normalize(tags, counts=usage) for path, tags in posts.items()}
+    while True:
+        counts = Counter(t for tags in current.values() for t in tags)
+        drop = {t for t, n in counts.items() if n == 1 and t not in KNOWN_TAGS}
+        pruned = {path: normalize(tags, drop, usage) for path, tags in current.items()}
+        if pruned == current:
+            return current
+        current = pruned
+
+
+def write_tags(filepath, tags):
+    text = filepath.read_text(encoding="utf-8")
+    tags_str = ", ".join(f'"{t}"' for t in tags)
+    text = TAGS_RE.sub(f"tags: [{tags_str}]", text, count=1)
+    filepath.write_text(text, encoding="utf-8")
+
+
+def scan_posts():
+    """Return {path: tags} for every article with a tags line."""
+    posts = {}
+    for md in sorted(POSTS_DIR.rglob("*.md")):
+        if md.name == "_index.md":
+            continue
+        tags = parse_tags(md.read_text(encoding="utf-8"))
+        if tags is not None:
+            posts[md] = tags
+    return posts
+
+
+def report(posts):
+    """Print the tag report; return (usage before trimming, usage after)."""
+    raw = Counter(t for tags in posts.values() for t in tags)
+    usage = Counter(t for tags in posts.values() for t in dict.fromkeys(map(canonical, tags)))
+    canon = Counter(t for tags in posts.values() for t in normalize(tags, counts=usage))
+    over = sum(1 for tags in posts.values() if len(set(map(canonical, tags))) > MAX_TAGS)
+    singletons = sorted(t for t, n in canon.items() if n == 1)
+
+    print(f"Articles: {len(posts)}")
+    print(
+        f"Distinct tags: {len(raw)} raw, {len(usage)} after canonicalization, "
+        f"{len(canon)} after trimming to {MAX_TAGS} per article"
+    )
+    print(f"Articles over {MAX_TAGS} tags: {over}")
+    print(f"Single-use tags: {len(singletons)}")
+
+    print(f"\nTop {TOP_N} tags:")
+    for tag, n in canon.most_common(TOP_N):
+        print(f"  {n:4d}  {tag}")
+
+    aliased = sorted(t for t in raw if t in ALIASES)
+    if aliased:
+        print("\nAliases in use:")
+        for t in aliased:
+            print(f"  {t} -> {ALIASES[t]} ({raw[t]})")
+
+    # Same spelling up to case, not covered by CANONICAL_TAGS yet
+    by_lower = {}
+    for t in canon:
+        by_lower.setdefault(t.lower(), []).append(t)
+    clashes = [v for v in by_lower.values() if len(v) > 1]
+    if clashes:
+        print("\nCase variants (add to CANONICAL_TAGS):")
+        for v in clashes:
+            print(f"  {' / '.join(sorted(v))}")
+
+    heavy = sorted(posts.items(), key=lambda kv: len(kv[1]), reverse=True)[:5]
+    print("\nMost tagged articles:")
+    for path, tags in heavy:
+        print(f"  {len(tags):3d}  {path.relative_to(POSTS_DIR)}")
+
+    print(f"\nSingle-use tags ({len(singletons)}):")
+    print("  " + ", ".join(singletons))
+    return usage, canon
+
+
+def main():
+    posts = scan_posts()
+    usage, _ = report(posts)
+
+    if "--write" not in sys.argv:
+        print("\n--- Run with --write to rewrite tags (add --prune to drop single-use tags) ---")
+        return
+
+    if "--prune" in sys.argv:
+        result = prune(posts, usage)
+    else:
+        result = {path: normalize(tags, counts=usage) for path, tags in posts.items()}
+
+    changed = 0
+    for path, tags in posts.items():
+        new_tags = result[path]
+        if new_tags != tags:
+            write_tags(path, new_tags)
+            changed += 1
+    print(f"\nRewrote tags in {changed} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Profile Hugo template render cost and track it across commits.
+
+Runs `hugo --templateMetrics --templateMetricsHints` (into a temporary
+destination, leaving public/ alone), parses the metrics table into records,
+flags uncached partials that Hugo reports as highly cacheable, and appends
+a summary to a JSON-lines history file so regressions between commits show
+up as deltas against the previous entry.
+
+Usage (from repo root):
+    python3 scripts/template_metrics.py                   # run hugo and record
+    python3 scripts/template_metrics.py --input out.txt   # parse saved hugo output
+    python3 scripts/template_metrics.py --input out.txt --commit abc1234  # and record it
+    python3 scripts/template_metrics.py --no-record       # do not append history
+    python3 scripts/template_metrics.py --history f.jsonl # use another history file
+    python3 scripts/template_metrics.py --trend           # print recorded history
+    python3 scripts/template_metrics.py --self-test       # parse recorded captures
+
+Saved output (--input) may come from any commit, so it is only recorded
+when --commit names the commit it was captured at.
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cli import arg_value, run_checks
+
+ROOT = Path(__file__).resolve().parent.parent
+HISTORY_FILE = ROOT / ".build_cache" / "template_metrics_history.jsonl"
+FIXTURES_DIR = ROOT / "scripts" / "fixtures"
+
+CACHE_POTENTIAL_MIN = 80  # percent; Hugo's hint that output rarely varies
+MIN_CALLS = 10  # ignore templates executed only a handful of times
+REGRESSION_TOLERANCE = 0.20
+REGRESSION_FLOOR_MS = 5.0  # ignore deltas on templates cheaper than this
+TOP_N = 15
+
+DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ns|us|µs|μs|ms|s|m|h)")
+DURATION_MS = {
+    "ns": 1e-6, "us": 1e-3, "µs": 1e-3, "μs": 1e-3,
+    "ms": 1.0, "s": 1e3, "m": 60e3, "h": 3600e3,
+}
+TOTAL_RE = re.compile(r"^Total in (\d+) ms", re.MULTILINE)
+# Newer Hugo pads the unit into its own column: "2.97  s", "106.32 µs"
+UNIT_GAP_RE = re.compile(r"(\d)\s+(ns|us|µs|μs|ms|s|m|h)(?=\s|$)")
+
+
+def parse_duration(text):
+    """Convert a Go duration string (e.g. 1m2.5s, 845µs) to milliseconds."""
+    parts = DURATION_RE.findall(text)
+    if not parts or "".join(n + u for n, u in parts) != text:
+        raise ValueError(f"bad duration: {text}")
+    return sum(float(n) * DURATION_MS[u] for n, u in parts)
+
+
+def parse_metrics(output):
+    """Parse hugo --templateMetrics output into a list of record dicts.
+
+    Handles the table with and without --templateMetricsHints columns.
+    """
+    records = []
+    lines = output.splitlines()
+    header = None
+    for i, line in enumerate(lines):
+        if "cumulative" in line and "average" in line:
+            header = i
+            break
+    if header is None:
+        return records
+
+    with_hints = "cache" in lines[header] or "cache" in lines[header + 1]
+    for line in lines[header + 1:]:
+        cols = UNIT_GAP_RE.sub(r"\1\2", line).split()
+        if not cols or set(cols[0]) == {"-"}:
+            continue
+        if cols[0] == "duration":
+            continue
+        try:
+            cumulative, average, maximum = (parse_duration(c) for c in cols[:3])
+        except ValueError:
+            if records:
+                break  # end of table
+            continue
+        rec = {
+            "template": cols[-1],
+            "cumulative_ms": round(cumulative, 3),
+            "average_ms": round(average, 3),
+            "maximum_ms": round(maximum, 3),
+        }
+        if with_hints and len(cols) >= 8:
+            rec["cache_potential"] = int(cols[3])
+            rec["percent_cached"] = int(cols[4])
+            rec["cached_count"] = int(cols[5])
+            rec["total_count"] = int(cols[6])
+        else:
+            rec["total_count"] = int(cols[3])
+        records.append(rec)
+    return records
+
+
+def cache_candidates(records):
+    """Uncached partials whose output Hugo reports as mostly identical."""
+    return [
+        r for r in records
+        if "partial" in r["template"]
+        and r.get("cache_potential", 0) >= CACHE_POTENTIAL_MIN
+        and r.get("percent_cached", 0) == 0
+        and r["total_count"] >= MIN_CALLS
+    ]
+
+
+def run_hugo():
+    """Build into a temporary directory and return hugo's combined output."""
+    if shutil.which("hugo") is None:
+        print("ERROR: hugo not found on PATH (use --input to parse saved output)")
+        sys.exit(1)
+    with tempfile.TemporaryDirectory() as dest:
+        result = subprocess.run(
+            ["hugo", "--templateMetrics", "--templateMetricsHints",
+             "--buildFuture", "--destination", dest],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+    if result.returncode != 0:
+        print(result.stdout + result.stderr)
+        print(f"ERROR: hugo exited with {result.returncode}")
+        sys.exit(1)
+    return result.stdout + result.stderr
+
+
+def git_commit():
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+    )
+    return result.stdout.strip() if result.returncode == 0 else "unknown"
+
+
+def load_history(path):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def append_history(path, entry):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def compare(prev, entry):
+    """Return regression lines for templates slower than the previous entry."""
+    old = {t["template"]: t["cumulative_ms"] for t in prev["templates"]}
+    lines = []
+    for t in entry["templates"]:
+        before = old.get(t["template"])
+        now = t["cumulative_ms"]
+        if before is None or now < REGRESSION_FLOOR_MS:
+            continue
+        if now > before * (1 + REGRESSION_TOLERANCE):
+            lines.append(f"{t['template']}: {before:.1f} ms -> {now:.1f} ms")
+    if prev.get("total_ms") and entry.get("total_ms"):
+        if entry["total_ms"] > prev["total_ms"] * (1 + REGRESSION_TOLERANCE):
+            lines.append(f"build total: {prev['total_ms']} ms -> {entry['total_ms']} ms")
+    return lines
+
+
+def print_records(records):
+    print(f"{'cumul ms':>10s} {'avg ms':>8s} {'max ms':>8s} {'pot':>4s} {'cached':>6s} {'count':>6s}  template")
+    for r in records[:TOP_N]:
+        print(
+            f"{r['cumulative_ms']:10.1f} {r['average_ms']:8.2f} {r['maximum_ms']:8.2f} "
+            f"{r.get('cache_potential', 0):4d} {r.get('percent_cached', 0):5d}% "
+            f"{r['total_count']:6d}  {r['template']}"
+        )
+
+
+def print_trend(history):
+    if not history:
+        print("No history recorded yet")
+        return
+    print(f"{'date':19s} {'commit':10s} {'total ms':>9s}  slowest template")
+    for e in history:
+        top = e["templates"][0] if e["templates"] else {"template": "-", "cumulative_ms": 0}
+        total = e.get("total_ms") or 0
+        print(
+            f"{e['date']:19s} {e['commit']:10s} {total:9d}  "
+            f"{top['template']} ({top['cumulative_ms']:.1f} ms)"
+        )
+
+
+def self_test():
+    """Parse the recorded hugo captures in scripts/fixtures/.
+
+    template_metrics_site.txt is this site built without the PaperMod
+    submodule; template_metrics_partials.txt is a small site whose header
+    partial is uncached but identical on every page.
+    """
+    def load(name):
+        output = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+        records = {r["template"]: r for r in parse_metrics(output)}
+        return output, records
+
+    site_out, site = load("template_metrics_site.txt")
+    part_out, part = load("template_metrics_partials.txt")
+    run_checks([
+        ("site: all 6 templates parsed", len(site) == 6),
+        ("site: '2.97  s' read as seconds", site["rss.xml"]["cumulative_ms"] == 2970.0),
+        ("site: µs durations", site["_markup/render-table.rss.xml"]["average_ms"] == 0.106),
+        ("site: counts", site["_markup/render-codeblock-mermaid.html"]["total_count"] == 78),
+        ("site: build total", TOTAL_RE.search(site_out).group(1) == "3097"),
+        ("site: no cache candidates", cache_candidates(list(site.values())) == []),
+        ("partials: all 5 templates parsed", len(part) == 5),
+        ("partials: hint columns", part["_partials/footer.html"]["percent_cached"] == 98
+         and part["_partials/footer.html"]["cached_count"] == 41),
+        ("partials: uncached header flagged",
+         [r["template"] for r in cache_candidates(list(part.values()))] == ["_partials/header.html"]),
+    ])
+
+
+def main():
+    if "--self-test" in sys.argv:
+        self_test()
+        return
+
+    history_path = Path(arg_value("--history") or HISTORY_FILE)
+    if "--trend" in sys.argv:
+        print_trend(load_history(history_path))
+        return
+
+    input_file = arg_value("--input")
+    commit = arg_value("--commit")
+    if input_file:
+        output = Path(input_file).read_text(encoding="utf-8")
+    else:
+        output = run_hugo()
+        commit = commit or git_commit()
+
+    records = parse_metrics(output)
+    if not records:
+        print("ERROR: no template metrics found in hugo output")
+        sys.exit(1)
+    records.sort(key=lambda r: r["cumulative_ms"], reverse=True)
+    total = TOTAL_RE.search(output)
+
+    print(f"Templates: {len(records)}" + (f", build total {total.group(1)} ms" if total else ""))
+    print_records(records)
+
+    candidates = cache_candidates(records)
+    if candidates:
+        print(f"\nUncached partials with cache potential >= {CACHE_POTENTIAL_MIN}%"
+              " (consider partialCached):")
+        for r in candidates:
+            print(f"  {r['template']}: {r['total_count']} calls, {r['cumulative_ms']:.1f} ms,"
+                  f" potential {r['cache_potential']}%")
+
+    entry = {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit or "unknown",
+        "total_ms": int(total.group(1)) if total else None,
+        "templates": records,
+    }
+    history = load_history(history_path)
+    if history:
+        regressions = compare(history[-1], entry)
+        if regressions:
+            print(f"\nSlower than {history[-1]['commit']} (> {REGRESSION_TOLERANCE:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+
+    if "--no-record" in sys.argv:
+        return
+    if commit is None:
+        print("\nNot recorded: pass --commit <sha> to record saved output")
+        return
+    append_history(history_path, entry)
+    print(f"\nAppended to {history_path}")
+
+
+if __name__ == "__main__":
+    main()
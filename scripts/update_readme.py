@@ -2,14 +2,17 @@
 """Auto-generate README.md from article front matter.
 
 Usage:
-    python3 scripts/update_readme.py          # preview to stdout
-    python3 scripts/update_readme.py --write  # overwrite README.md
+    python3 scripts/update_readme.py                    # preview to stdout
+    python3 scripts/update_readme.py --write            # overwrite README.md
+    python3 scripts/update_readme.py --write --changed  # skip if no post changed
 """
 
 import re
 import sys
 from pathlib import Path
 
+from changes import commit_manifest, detect_changes, has_changes
+
 ROOT = Path(__file__).resolve().parent.parent
 POSTS_DIR = ROOT / "content" / "posts"
 
@@ -152,14 +155,24 @@ def generate_readme(articles_by_cat):
 
 
 def main():
+    readme_path = ROOT / "README.md"
+    current = None
+    if "--changed" in sys.argv:
+        # Added/deleted/renamed posts all regenerate the full index
+        changes, current = detect_changes("readme")
+        if not has_changes(changes) and readme_path.exists():
+            print("README.md up to date: no posts changed")
+            return
+
     articles = scan_articles()
     readme = generate_readme(articles)
 
     if "--write" in sys.argv:
-        readme_path = ROOT / "README.md"
         readme_path.write_text(readme, encoding="utf-8")
         total = sum(len(v) for v in articles.values())
         print(f"README.md updated: {total} articles")
+        if current is not None:
+            commit_manifest("readme", current)
     else:
         print(readme)
         print("\n--- Run with --write to overwrite README.md ---")
@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""Batch upload Hugo markdown articles to juejin.cn as drafts."""
+"""Batch upload Hugo markdown articles to juejin.cn as drafts.
+
+Usage (from repo root):
+    python3 scripts/upload_juejin.py            # all posts not yet uploaded
+    python3 scripts/upload_juejin.py --changed  # only posts changed in git since last run
+"""
 
 import os
 import re
@@ -10,9 +15,13 @@ import yaml
 import requests
 from pathlib import Path
 
+from changes import changed_paths, commit_manifest, detect_changes, rename_keys
+from taxonomy import HUGO_TAG_MAP
+
 # ── Config ──────────────────────────────────────────────────────────────
 COOKIE = os.environ.get("JUEJIN_COOKIE", "")
-CONTENT_DIR = Path(__file__).resolve().parent.parent / "content" / "posts"
+ROOT = Path(__file__).resolve().parent.parent
+CONTENT_DIR = ROOT / "content" / "posts"
 RESULT_LOG = Path(__file__).resolve().parent / "juejin_upload_log.json"
 DELAY_SEC = 3  # seconds between API calls
 
@@ -20,7 +29,7 @@ DELAY_SEC = 3  # seconds between API calls
 CATEGORY_ID = "6809637769959178254"
 
 # juejin API endpoints
-API_BASE = "https://api.juejin.cn"
+API_BASE = os.environ.get("JUEJIN_API_BASE", "https://api.juejin.cn")
 API_CREATE_DRAFT = f"{API_BASE}/content_api/v1/article_draft/create"
 API_QUERY_TAG = f"{API_BASE}/tag_api/v1/query_tag_list"
 
@@ -46,24 +55,6 @@ TAG_CACHE = {
     "后端": "6809640408797167623",
 }
 
-# Hugo tag -> juejin tag name mapping
-HUGO_TAG_MAP = {
-    "C++": "C++", "C++11": "C++", "C++14": "C++", "C++17": "C++",
-    "C": "C语言", "C11": "C语言", "C99": "C语言", "C语言": "C语言",
-    "embedded": "嵌入式", "嵌入式": "嵌入式",
-    "Linux": "Linux", "linux": "Linux", "ARM-Linux": "Linux",
-    "ARM": "嵌入式", "Cortex-M": "嵌入式", "MCU": "嵌入式",
-    "RTOS": "嵌入式", "RT-Thread": "嵌入式", "bare-metal": "嵌入式",
-    "performance": "性能优化", "性能优化": "性能优化",
-    "benchmark": "性能优化", "profiling": "性能优化",
-    "architecture": "架构", "架构设计": "架构",
-    "design-pattern": "设计模式",
-    "lock-free": "后端", "concurrency": "后端",
-    "message-bus": "消息队列", "消息队列": "消息队列",
-    "state-machine": "状态机", "FSM": "状态机", "HSM": "状态机",
-    "状态机": "状态机",
-}
-
 
 def query_tag_id(keyword: str) -> str | None:
     """Query juejin API for a tag ID by keyword."""
@@ -86,19 +77,21 @@ def query_tag_id(keyword: str) -> str | None:
     return None
 
 
-def resolve_tags(hugo_tags: list[str]) -> list[str]:
-    """Map Hugo tags to juejin tag_ids. Limited to 1 tag (account restriction)."""
-    for ht in hugo_tags:
-        jj_name = HUGO_TAG_MAP.get(ht)
-        if not jj_name:
-            continue
-        tid = query_tag_id(jj_name)
+def resolve_tag_names(names: list[str]) -> list[str]:
+    """Map juejin tag names to tag_ids. Limited to 1 tag (account restriction)."""
+    for name in names:
+        tid = query_tag_id(name)
         if tid:
             return [tid]
     # Fallback: C++
     return [TAG_CACHE["C++"]]
 
 
+def resolve_tags(hugo_tags: list[str]) -> list[str]:
+    """Map Hugo tags to juejin tag_ids via HUGO_TAG_MAP."""
+    return resolve_tag_names([HUGO_TAG_MAP[t] for t in hugo_tags if HUGO_TAG_MAP.get(t)])
+
+
 def parse_frontmatter(text: str) -> tuple[dict, str]:
     """Parse YAML frontmatter and return (metadata, body)."""
     m = re.match(r"^---\s*\n(.*?)\n---\s*\n", text, re.DOTALL)
@@ -109,10 +102,17 @@ def parse_frontmatter(text: str) -> tuple[dict, str]:
     return fm or {}, body
 
 
-def collect_articles() -> list[dict]:
-    """Scan content/posts for all markdown articles."""
+def collect_articles(paths: list[str] | None = None) -> list[dict]:
+    """Scan content/posts for markdown articles.
+
+    If paths (relative to the repo root) is given, only those files are read.
+    """
+    if paths is None:
+        md_paths = sorted(CONTENT_DIR.rglob("*.md"))
+    else:
+        md_paths = [ROOT / p for p in sorted(paths) if (ROOT / p).is_file()]
     articles = []
-    for md_path in sorted(CONTENT_DIR.rglob("*.md")):
+    for md_path in md_paths:
         if md_path.name == "_index.md":
             continue
         text = md_path.read_text(encoding="utf-8")
@@ -126,7 +126,7 @@ def collect_articles() -> list[dict]:
         articles.append({
             "path": str(md_path.relative_to(CONTENT_DIR)),
             "title": title,
-            "summary": summary[:100] if summary else "",
+            "summary": summary or "",
             "hugo_tags": hugo_tags,
             "categories": categories,
             "body": body,
@@ -134,16 +134,17 @@ def collect_articles() -> list[dict]:
     return articles
 
 
-def create_draft(article: dict) -> dict:
+def create_draft(article: dict, tag_ids: list[str] | None = None) -> dict:
     """Create a draft on juejin and return the API response."""
-    tag_ids = resolve_tags(article["hugo_tags"])
+    if tag_ids is None:
+        tag_ids = resolve_tags(article["hugo_tags"])
     payload = {
         "category_id": CATEGORY_ID,
         "tag_ids": tag_ids,
         "link_url": "",
         "cover_image": "",
         "title": article["title"],
-        "brief_content": article["summary"],
+        "brief_content": article["summary"][:100],
         "edit_type": 10,
         "html_content": "deprecated",
         "mark_content": article["body"],
@@ -170,10 +171,18 @@ def main():
         print("ERROR: set JUEJIN_COOKIE env variable first")
         sys.exit(1)
 
-    articles = collect_articles()
+    log = load_log()
+    current = None
+    if "--changed" in sys.argv:
+        # Only read posts whose git blob changed; move log entries of renamed posts
+        changes, current = detect_changes("juejin")
+        if rename_keys(log, changes["renamed"]):
+            save_log(log)
+        articles = collect_articles(changed_paths(changes))
+    else:
+        articles = collect_articles()
     print(f"Found {len(articles)} articles\n")
 
-    log = load_log()
     done = 0
     fail = 0
 
@@ -207,6 +216,8 @@ def main():
 
     print(f"\nDone: {done} success, {fail} failed")
     print(f"Log saved to {RESULT_LOG}")
+    if current is not None and fail == 0:
+        commit_manifest("juejin", current)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Vendor a pinned Mermaid bundle into static/ so the site serves it itself.
+
+The version is params.mermaidVersion in hugo.yaml, shared with baseof.html,
+which loads static/js/mermaid-<version>.min.js lazily when present and
+otherwise falls back to the same version on jsDelivr. Bumping the version
+fetches the new bundle and removes the old one.
+
+params.mermaidSha256 pins the bundle's content: a download is written only
+if its sha256 matches, and an existing file (e.g. restored from the CI
+cache) that does not match is fetched again. After bumping the version,
+run --pin once to record the new hash, and review it in the diff.
+
+A failed download, a hash mismatch or a missing pin is an error in CI (the
+CI variable is set), so a deploy never silently falls back to the CDN;
+locally it only prints a warning.
+
+Usage (from repo root):
+    python3 scripts/vendor_mermaid.py           # fetch if missing
+    python3 scripts/vendor_mermaid.py --force   # re-download
+    python3 scripts/vendor_mermaid.py --pin     # download and record its sha256
+"""
+
+import hashlib
+import os
+import re
+import sys
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HUGO_CONFIG = ROOT / "hugo.yaml"
+JS_DIR = ROOT / "static" / "js"
+
+SHA256_RE = re.compile(r'^(\s+mermaidSha256:\s*)"?([0-9a-f]*)"?', re.MULTILINE)
+
+
+def read_params():
+    """Read params.mermaidVersion and mermaidSha256 from hugo.yaml without
+    a YAML parser; the hash is "" when not pinned."""
+    text = HUGO_CONFIG.read_text(encoding="utf-8")
+    m = re.search(r'^\s+mermaidVersion:\s*"?([^"\s#]+)"?', text, re.MULTILINE)
+    if not m:
+        print("ERROR: params.mermaidVersion not set in hugo.yaml")
+        sys.exit(1)
+    pin = SHA256_RE.search(text)
+    return m.group(1), pin.group(2) if pin else ""
+
+
+def write_pin(digest):
+    text = HUGO_CONFIG.read_text(encoding="utf-8")
+    if not SHA256_RE.search(text):
+        print("ERROR: params.mermaidSha256 line not found in hugo.yaml")
+        sys.exit(1)
+    text = SHA256_RE.sub(lambda m: f'{m.group(1)}"{digest}"', text, count=1)
+    HUGO_CONFIG.write_text(text, encoding="utf-8")
+
+
+def fail(message):
+    """Exit in CI; locally warn, leaving pages on the CDN fallback."""
+    if os.environ.get("CI"):
+        print(f"ERROR: {message}")
+        sys.exit(1)
+    print(f"[WARN] {message}, pages will load Mermaid from the CDN")
+
+
+def main():
+    version, pinned = read_params()
+    url = f"https://cdn.jsdelivr.net/npm/mermaid@{version}/dist/mermaid.min.js"
+    dest = JS_DIR / f"mermaid-{version}.min.js"
+
+    for old in JS_DIR.glob("mermaid-*.min.js"):
+        if old != dest:
+            old.unlink()
+            print(f"Removed old bundle: {old.relative_to(ROOT)}")
+
+    pin = "--pin" in sys.argv
+    if not pinned and not pin:
+        fail(f"params.mermaidSha256 not set, run vendor_mermaid.py --pin for {version}")
+        return
+    if dest.exists() and not pin and "--force" not in sys.argv:
+        if hashlib.sha256(dest.read_bytes()).hexdigest() == pinned:
+            print(f"Already vendored: {dest.relative_to(ROOT)}")
+            return
+        print(f"Hash mismatch, fetching again: {dest.relative_to(ROOT)}")
+        dest.unlink()
+
+    try:
+        with urllib.request.urlopen(url, timeout=60) as resp:
+            data = resp.read()
+    except OSError as e:
+        fail(f"download of mermaid {version} failed: {e}")
+        return
+    digest = hashlib.sha256(data).hexdigest()
+    if pin:
+        write_pin(digest)
+        print(f"Pinned mermaid {version}: sha256 {digest}")
+    elif digest != pinned:
+        fail(f"mermaid {version} sha256 is {digest}, hugo.yaml pins {pinned}")
+        return
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(data)
+    print(f"Vendored mermaid {version}: {dest.relative_to(ROOT)} ({len(data)} bytes)")
+
+
+if __name__ == "__main__":
+    main()